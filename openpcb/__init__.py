@@ -0,0 +1,8 @@
+"""OpenPCB - unified PCB CAM and multi-machine sender."""
+
+import logging
+
+# Library-style logging: stay silent unless the application (or the user,
+# via OPENPCB_LOG) installs a real handler. Avoids paying for handler and
+# formatter setup during the pre-QApplication startup window.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
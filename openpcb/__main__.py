@@ -9,14 +9,9 @@ from __future__ import annotations
 import logging
 import sys
 
+from openpcb.logging_setup import logging_requested, setup_logging
 
-def setup_logging() -> None:
-    """Configure application logging."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+logger = logging.getLogger("openpcb.main")
 
 
 def main_gui() -> int:
@@ -26,8 +21,8 @@ def main_gui() -> int:
     Returns:
         Exit code (0 for success)
     """
-    setup_logging()
-    logger = logging.getLogger(__name__)
+    if logging_requested():
+        setup_logging()
 
     try:
         # Import Qt first to set attributes
@@ -50,7 +45,7 @@ def main_gui() -> int:
         QApplication.setAttribute(Qt.AA_DontUseNativeMenuBar, True)
 
         # Configure HiDPI environment variables
-        from openpcb.ui.hidpi import configure_hidpi
+        from openpcb.ui.hidpi import apply_hidpi_stylesheet, configure_hidpi
 
         configure_hidpi()
 
@@ -65,8 +60,6 @@ def main_gui() -> int:
         app.setOrganizationDomain("openpcb.org")
 
         # Apply HiDPI stylesheet
-        from openpcb.ui.hidpi import apply_hidpi_stylesheet
-
         apply_hidpi_stylesheet(app)
 
         # Create and show main window
@@ -15,7 +15,7 @@ Usage:
 """
 
 from .defaults import get_preset
-from .manager import ConfigManager, config_manager
+from .manager import ConfigManager, get_config_manager
 from .models import (
     ApplicationSettings,
     ColorScheme,
@@ -28,10 +28,21 @@ from .models import (
     WorkspaceSettings,
 )
 
+
+def __getattr__(name: str):
+    # Keep `from openpcb.config import config_manager` working while
+    # deferring singleton construction (and its directory-creation side
+    # effects) until the first actual use.
+    if name == "config_manager":
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Manager
     "ConfigManager",
     "config_manager",
+    "get_config_manager",
     # Models
     "OpenPCBConfig",
     "ApplicationSettings",
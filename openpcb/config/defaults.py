@@ -4,7 +4,16 @@ Default configuration presets for OpenPCB.
 Provides common configurations for different workflows and display setups.
 """
 
-from .models import ColorScheme, DisplaySettings, HiDPIScaleMode, HiDPISettings, OpenPCBConfig, Units
+import functools
+
+from .models import (
+    ColorScheme,
+    DisplaySettings,
+    HiDPIScaleMode,
+    HiDPISettings,
+    OpenPCBConfig,
+    Units,
+)
 
 # Display presets
 DISPLAY_DARK_THEME = DisplaySettings(
@@ -59,6 +68,19 @@ UNITS_METRIC = {"units": Units.MILLIMETERS, "decimal_places": 3}
 UNITS_IMPERIAL = {"units": Units.INCHES, "decimal_places": 4}
 
 
+# Preset factories; materialized lazily so importing this module does not
+# run pydantic validation for five full configs up front. The configs are
+# frozen, so each one is built at most once (see the cache on get_preset).
+_PRESET_FACTORIES = {
+    "default": lambda: OpenPCBConfig(),
+    "light": lambda: OpenPCBConfig(display=DISPLAY_LIGHT_THEME),
+    "high-contrast": lambda: OpenPCBConfig(display=DISPLAY_HIGH_CONTRAST),
+    "4k": lambda: OpenPCBConfig(display=DISPLAY_DARK_THEME, hidpi=HIDPI_4K),
+    "no-scaling": lambda: OpenPCBConfig(display=DISPLAY_DARK_THEME, hidpi=HIDPI_DISABLED),
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_preset(name: str) -> OpenPCBConfig | None:
     """
     Get a preset configuration by name.
@@ -70,12 +92,5 @@ def get_preset(name: str) -> OpenPCBConfig | None:
     - "4k": Dark theme, 4K display optimized
     - "no-scaling": Dark theme, HiDPI disabled
     """
-    presets = {
-        "default": OpenPCBConfig(),
-        "light": OpenPCBConfig(display=DISPLAY_LIGHT_THEME),
-        "high-contrast": OpenPCBConfig(display=DISPLAY_HIGH_CONTRAST),
-        "4k": OpenPCBConfig(display=DISPLAY_DARK_THEME, hidpi=HIDPI_4K),
-        "no-scaling": OpenPCBConfig(display=DISPLAY_DARK_THEME, hidpi=HIDPI_DISABLED),
-    }
-
-    return presets.get(name)
+    factory = _PRESET_FACTORIES.get(name)
+    return factory() if factory is not None else None
@@ -7,18 +7,21 @@ persistence to disk using orjson for performance.
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import logging
+import os
 import threading
 from pathlib import Path
 from typing import Any
 
-import orjson
-from platformdirs import user_cache_dir, user_config_dir, user_data_dir
-
 from .models import OpenPCBConfig
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for "field not present" in the update pre-check below.
+_UNSET = object()
+
 
 class ConfigManager:
     """
@@ -38,7 +41,7 @@ class ConfigManager:
     """
 
     _instance: ConfigManager | None = None
-    _lock = threading.RLock()
+    _lock = threading.Lock()
 
     def __new__(cls) -> ConfigManager:
         """Ensure singleton instance."""
@@ -54,32 +57,80 @@ class ConfigManager:
             return
 
         self._initialized = True
-        self._config: OpenPCBConfig | None = None
-        self._config_lock = threading.RLock()
+
+        # Deferred import: platformdirs is only needed once, here
+        from platformdirs import user_cache_dir, user_config_dir, user_data_dir
 
         # Platform-specific directories
-        self._config_dir = Path(user_config_dir("openpcb", "openpcb"))
-        self._cache_dir = Path(user_cache_dir("openpcb", "openpcb"))
-        self._data_dir = Path(user_data_dir("openpcb", "openpcb"))
+        self._init_state(
+            config_dir=Path(user_config_dir("openpcb", "openpcb")),
+            cache_dir=Path(user_cache_dir("openpcb", "openpcb")),
+            data_dir=Path(user_data_dir("openpcb", "openpcb")),
+        )
+
+        logger.info("Config directory: %s", self._config_dir)
+
+    def _init_state(self, config_dir: Path, cache_dir: Path, data_dir: Path) -> None:
+        """Initialize per-instance state for the given directories."""
+        self._config: OpenPCBConfig | None = None
+        # Plain Lock (cheaper than RLock to acquire); methods never re-enter
+        # it - internal *_locked helpers assume the caller holds it.
+        self._config_lock = threading.Lock()
+
+        # batch_update() state: while saving is suspended, update_* calls
+        # only touch the in-memory model and mark it dirty.
+        self._suspend_save = False
+        self._batch_dirty = False
+
+        # Background persistence: update_* methods set _dirty and return;
+        # the lazily-started writer thread coalesces pending changes into
+        # one disk write. _write_lock serializes the actual file writes so
+        # a flush cannot interleave with (or be clobbered by) the writer.
+        self._dirty = threading.Event()
+        self._write_lock = threading.Lock()
+        self._writer_thread: threading.Thread | None = None
+
+        self._config_dir = config_dir
+        self._cache_dir = cache_dir
+        self._data_dir = data_dir
 
         self._config_file = self._config_dir / "settings.json"
 
-        # Ensure directories exist
+        # Only the config directory is needed at startup (by load/save);
+        # cache and data directories are created on first access.
         self._config_dir.mkdir(parents=True, exist_ok=True)
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
-        self._data_dir.mkdir(parents=True, exist_ok=True)
-
-        logger.info(f"Config directory: {self._config_dir}")
-        logger.info(f"Cache directory: {self._cache_dir}")
-        logger.info(f"Data directory: {self._data_dir}")
+        self._cache_dir_created = False
+        self._data_dir_created = False
+
+    @classmethod
+    def _new_for_path(cls, config_dir: Path) -> ConfigManager:
+        """
+        Create an isolated (non-singleton) manager rooted at config_dir.
+
+        Test-only factory: bypasses the singleton __new__ so persistence
+        tests get independent instances with their own lock and config
+        file instead of mutating the shared global manager.
+        """
+        manager = object.__new__(cls)
+        manager._initialized = True
+        manager._init_state(
+            config_dir=config_dir,
+            cache_dir=config_dir / "cache",
+            data_dir=config_dir / "data",
+        )
+        return manager
 
     @property
     def config(self) -> OpenPCBConfig:
         """Get current configuration (thread-safe)."""
         with self._config_lock:
-            if self._config is None:
-                self._config = self.load()
-            return self._config
+            return self._ensure_config_locked()
+
+    def _ensure_config_locked(self) -> OpenPCBConfig:
+        """Return the current config, loading it if needed (lock held)."""
+        if self._config is None:
+            self._config = self._load_locked()
+        return self._config
 
     @property
     def config_dir(self) -> Path:
@@ -88,101 +139,235 @@ class ConfigManager:
 
     @property
     def cache_dir(self) -> Path:
-        """Get cache directory path."""
+        """Get cache directory path (created on first access)."""
+        if not self._cache_dir_created:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_dir_created = True
+            logger.debug("Cache directory: %s", self._cache_dir)
         return self._cache_dir
 
     @property
     def data_dir(self) -> Path:
-        """Get data directory path."""
+        """Get data directory path (created on first access)."""
+        if not self._data_dir_created:
+            self._data_dir.mkdir(parents=True, exist_ok=True)
+            self._data_dir_created = True
+            logger.debug("Data directory: %s", self._data_dir)
         return self._data_dir
 
     def load(self) -> OpenPCBConfig:
         """Load configuration from disk or create default."""
         with self._config_lock:
-            if not self._config_file.exists():
-                logger.info("No config file found, creating default")
-                config = OpenPCBConfig()
-                self.save(config)
-                return config
+            return self._load_locked()
+
+    def _load_locked(self) -> OpenPCBConfig:
+        """Load configuration from disk or create default (lock held)."""
+        import orjson
+
+        if not self._config_file.exists():
+            logger.info("No config file found, creating default")
+            config = OpenPCBConfig()
+            self._write_config(config)
+            return config
+
+        try:
+            data = orjson.loads(self._config_file.read_bytes())
+            config = OpenPCBConfig.model_validate_json_safe(data)
+            logger.info("Configuration loaded successfully")
+            return config
+        except Exception as e:
+            logger.error("Failed to load config: %s", e)
+            logger.warning("Using default configuration")
+            return OpenPCBConfig()
+
+    def save(self, config: OpenPCBConfig | None = None, *, pretty: bool = False) -> None:
+        """
+        Save configuration to disk.
+
+        Args:
+            config: Configuration to save (current one if None).
+            pretty: Indent and sort keys for human readers. The default is
+                compact output; the file is machine-consumed and pretty
+                printing costs extra bytes plus a key-sort pass in orjson.
+        """
+        with self._write_lock:
+            with self._config_lock:
+                if config is None:
+                    config = self._config
+                if config is None:
+                    logger.warning("No configuration to save")
+                    return
+                # The explicit write below supersedes any queued one
+                self._dirty.clear()
+            self._write_config(config, pretty=pretty)
+
+    def _write_config(self, config: OpenPCBConfig, *, pretty: bool = False) -> None:
+        """Serialize a config snapshot and atomically write it to disk.
+
+        Touches no mutable manager state, so callers only need the write
+        lock (or exclusive access) - not the config lock - while the file
+        I/O runs.
+        """
+        try:
+            if pretty:
+                # pydantic cannot sort keys, so the human-readable form
+                # goes through orjson over the JSON-mode dict.
+                import orjson
 
+                json_bytes = orjson.dumps(
+                    config.model_dump(mode="json"),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+                )
+            else:
+                # pydantic v2 serializes to JSON directly from its Rust
+                # core, skipping the intermediate dict traversal that
+                # model_dump + orjson.dumps would walk twice; dock_layout
+                # bytes get their hex form from the field serializer on
+                # WorkspaceSettings.
+                json_bytes = config.model_dump_json().encode()
+
+            # Atomic write via raw os primitives: open/write/fsync/close the
+            # temp file then rename over the target. Skips the extra Path
+            # object, context manager, and stat that pathlib's write_bytes +
+            # replace would add, and the fsync makes the rename durable.
+            temp_path = f"{self._config_file}.tmp"
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
             try:
-                data = orjson.loads(self._config_file.read_bytes())
-                config = OpenPCBConfig.model_validate_json_safe(data)
-                logger.info("Configuration loaded successfully")
-                return config
-            except Exception as e:
-                logger.error(f"Failed to load config: {e}")
-                logger.warning("Using default configuration")
-                return OpenPCBConfig()
-
-    def save(self, config: OpenPCBConfig | None = None) -> None:
-        """Save configuration to disk."""
+                os.write(fd, json_bytes)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp_path, self._config_file)
+
+            logger.info("Configuration saved to %s", self._config_file)
+        except Exception as e:
+            logger.error("Failed to save config: %s", e)
+            raise
+
+    def _update_section(self, section: str, kwargs: dict[str, Any]) -> None:
+        """Copy-update a single settings section and persist if it changed."""
         with self._config_lock:
-            if config is None:
-                config = self._config
-
-            if config is None:
-                logger.warning("No configuration to save")
+            config = self._ensure_config_locked()
+            current = getattr(config, section)
+            # Field-level pre-check: when every incoming value already
+            # matches, skip the model_copy and the save entirely. The
+            # identity test runs first so large blobs (dock_layout bytes)
+            # are not value-compared when the same object is passed back.
+            for key, value in kwargs.items():
+                existing = getattr(current, key, _UNSET)
+                if existing is not value and existing != value:
+                    break
+            else:
                 return
-
-            try:
-                # Convert to JSON-safe dict
-                data = config.model_dump_json_safe()
-
-                # Write with orjson (faster than stdlib json)
-                json_bytes = orjson.dumps(
-                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
-                )
-
-                # Atomic write (write to temp, then rename)
-                temp_file = self._config_file.with_suffix(".tmp")
-                temp_file.write_bytes(json_bytes)
-                temp_file.replace(self._config_file)
-
-                logger.info(f"Configuration saved to {self._config_file}")
-            except Exception as e:
-                logger.error(f"Failed to save config: {e}")
-                raise
+            self._config = config.model_copy(update={section: current.model_copy(update=kwargs)})
+            if self._suspend_save:
+                self._batch_dirty = True
+                return
+            self._queue_save_locked()
+
+    def _queue_save_locked(self) -> None:
+        """Hand the current config to the background writer (lock held)."""
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="openpcb-config-writer", daemon=True
+            )
+            # The writer is a daemon so it cannot block interpreter exit;
+            # flush whatever it has not written yet on shutdown instead.
+            atexit.register(self.flush)
+            self._writer_thread.start()
+        self._dirty.set()
+
+    def _writer_loop(self) -> None:
+        """Persist dirty config state until process exit (writer thread)."""
+        while True:
+            self._dirty.wait()
+            with self._write_lock:
+                with self._config_lock:
+                    # A flush()/save()/reset may have consumed the flag
+                    # between the wake-up and the lock acquisition; writing
+                    # anyway would trail behind a flush the caller believes
+                    # complete (e.g. into a test's deleted temp directory).
+                    if not self._dirty.is_set():
+                        continue
+                    self._dirty.clear()
+                    config = self._config
+                if config is None:
+                    continue
+                try:
+                    self._write_config(config)
+                except Exception:  # noqa: BLE001 - already logged; keep writing
+                    pass
+
+    def flush(self) -> None:
+        """Synchronously write any config change still queued for the writer."""
+        with self._write_lock:
+            with self._config_lock:
+                if not self._dirty.is_set():
+                    return
+                self._dirty.clear()
+                config = self._config
+            if config is not None:
+                self._write_config(config)
 
     def update_application(self, **kwargs: Any) -> None:
         """Update application settings."""
-        with self._config_lock:
-            current = self.config.application
-            updated = current.model_copy(update=kwargs)
-            self._config = self.config.model_copy(update={"application": updated})
-            self.save()
+        self._update_section("application", kwargs)
 
     def update_display(self, **kwargs: Any) -> None:
         """Update display settings."""
-        with self._config_lock:
-            current = self.config.display
-            updated = current.model_copy(update=kwargs)
-            self._config = self.config.model_copy(update={"display": updated})
-            self.save()
+        self._update_section("display", kwargs)
 
     def update_hidpi(self, **kwargs: Any) -> None:
         """Update HiDPI settings."""
-        with self._config_lock:
-            current = self.config.hidpi
-            updated = current.model_copy(update=kwargs)
-            self._config = self.config.model_copy(update={"hidpi": updated})
-            self.save()
+        self._update_section("hidpi", kwargs)
 
     def update_workspace(self, **kwargs: Any) -> None:
         """Update workspace settings."""
+        self._update_section("workspace", kwargs)
+
+    @contextlib.contextmanager
+    def batch_update(self):
+        """
+        Coalesce the saves from several update_* calls into one disk write.
+
+        Usage:
+            with config_manager.batch_update():
+                config_manager.update_display(...)
+                config_manager.update_hidpi(...)
+
+        Inside the context update_* methods only mutate the in-memory
+        config; a single save is queued on exit if anything changed.
+        """
         with self._config_lock:
-            current = self.config.workspace
-            updated = current.model_copy(update=kwargs)
-            self._config = self.config.model_copy(update={"workspace": updated})
-            self.save()
+            self._suspend_save = True
+        try:
+            yield self
+        finally:
+            with self._config_lock:
+                self._suspend_save = False
+                if self._batch_dirty:
+                    self._batch_dirty = False
+                    self._queue_save_locked()
 
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults."""
-        with self._config_lock:
-            self._config = OpenPCBConfig()
-            self.save()
+        with self._write_lock:
+            with self._config_lock:
+                self._config = config = OpenPCBConfig()
+                # The defaults written below supersede any queued save
+                self._dirty.clear()
+            self._write_config(config)
             logger.info("Configuration reset to defaults")
 
 
-# Global singleton instance
-config_manager = ConfigManager()
+# Global singleton instance, created lazily so that importing openpcb.config
+# (e.g. for a pure CLI run) does not touch the filesystem or log anything.
+_config_manager: ConfigManager | None = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Return the global ConfigManager, creating it on first use."""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
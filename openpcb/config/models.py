@@ -7,10 +7,15 @@ All settings are immutable by default (frozen=True) to prevent accidental modifi
 
 from __future__ import annotations
 
+import re
 from enum import Enum
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_serializer, field_validator
+
+# Precompiled #rgb / #rrggbb matcher; the validator runs on every model
+# construction, including each model_copy in the config update path.
+_HEX_COLOR_RE = re.compile(r"#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})\Z")
 
 
 class Units(str, Enum):
@@ -38,12 +43,15 @@ class HiDPIScaleMode(str, Enum):
 
 # Window geometry storage
 class WindowGeometry(BaseModel):
-    """Window position and size."""
+    """
+    Window geometry, stored as Qt's native saveGeometry() blob (base64).
+
+    The opaque blob also captures multi-monitor placement, which the old
+    x/y/width/height fields could not, and restores through a single
+    restoreGeometry() call instead of per-field validation.
+    """
 
-    x: int = 100
-    y: int = 100
-    width: int = 1280
-    height: int = 800
+    geometry_b64: str | None = None
     maximized: bool = False
 
     model_config = {"frozen": True}
@@ -88,13 +96,9 @@ class DisplaySettings(BaseModel):
     @classmethod
     def validate_hex_color(cls, v: str) -> str:
         """Validate hex color format."""
-        if not v.startswith("#") or len(v) not in (4, 7):
+        if not _HEX_COLOR_RE.fullmatch(v):
             raise ValueError(f"Invalid hex color: {v}")
-        try:
-            int(v[1:], 16)
-        except ValueError as e:
-            raise ValueError(f"Invalid hex color: {v}") from e
-        return v.lower()
+        return v if v.islower() else v.lower()
 
 
 # HiDPI settings
@@ -160,6 +164,23 @@ class WorkspaceSettings(BaseModel):
 
     model_config = {"frozen": True}
 
+    @field_validator("dock_layout", mode="before")
+    @classmethod
+    def _dock_layout_from_hex(cls, v: object) -> object:
+        """Accept the hex-string form written by JSON serialization."""
+        if isinstance(v, str):
+            return bytes.fromhex(v)
+        return v
+
+    @field_serializer("dock_layout", when_used="json")
+    def _dock_layout_to_hex(self, v: bytes | None) -> str | None:
+        """Serialize the layout blob as hex for JSON output.
+
+        bytes.hex() is a C-implemented PyBytes method and beats base64's
+        table-driven chunking for dock-layout-sized blobs.
+        """
+        return v.hex() if v is not None else None
+
 
 # Root configuration
 class OpenPCBConfig(BaseModel):
@@ -177,28 +198,19 @@ class OpenPCBConfig(BaseModel):
     model_config = {"frozen": True}
 
     def model_dump_json_safe(self) -> dict:
-        """Dump model to JSON-safe dict (convert bytes to base64)."""
-        import base64
-
-        data = self.model_dump()
+        """Dump model to JSON-safe dict.
 
-        # Convert bytes fields to base64 strings
-        if data["workspace"]["dock_layout"] is not None:
-            data["workspace"]["dock_layout"] = base64.b64encode(
-                data["workspace"]["dock_layout"]
-            ).decode("ascii")
-
-        return data
+        Thin wrapper over model_dump(mode="json"); the dock_layout bytes
+        field handles its own hex conversion via a field serializer, so no
+        post-processing pass over the dict is needed.
+        """
+        return self.model_dump(mode="json")
 
     @classmethod
     def model_validate_json_safe(cls, data: dict) -> OpenPCBConfig:
-        """Load model from JSON-safe dict (convert base64 to bytes)."""
-        import base64
-
-        # Convert base64 strings back to bytes
-        if data.get("workspace", {}).get("dock_layout") is not None:
-            data["workspace"]["dock_layout"] = base64.b64decode(
-                data["workspace"]["dock_layout"]
-            )
+        """Load model from JSON-safe dict.
 
+        Thin wrapper over model_validate; the dock_layout field accepts
+        its hex-string form through a before-validator.
+        """
         return cls.model_validate(data)
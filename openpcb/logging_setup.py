@@ -0,0 +1,37 @@
+"""
+Logging setup for OpenPCB.
+
+Shared by the GUI and CLI entry points so neither pulls in the other's
+import graph just to configure logging.
+
+Console logging is opt-in via the OPENPCB_LOG environment variable; by
+default the package-level NullHandler (see openpcb/__init__.py) keeps
+startup free of handler/formatter setup cost.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+_configured = False
+
+
+def logging_requested() -> bool:
+    """Return True if the user requested console logging via OPENPCB_LOG."""
+    return bool(os.environ.get("OPENPCB_LOG"))
+
+
+def setup_logging() -> None:
+    """Configure application logging (idempotent)."""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    # asctime uses logging's default ISO-like format; an explicit datefmt
+    # would call time.strftime per record.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
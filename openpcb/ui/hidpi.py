@@ -35,6 +35,7 @@ GNOME's global menu system from interfering with Qt menu bar rendering.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import sys
@@ -45,6 +46,78 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Platform checks resolved once at import; sys.platform never changes and
+# the win32 branch below must only touch ctypes on Windows.
+_IS_WIN32 = sys.platform == "win32"
+_IS_DARWIN = sys.platform == "darwin"
+
+# True once SetProcessDpiAwareness has been attempted (Windows only).
+_dpi_awareness_set = False
+
+# Lazily-resolved QApplication class. Resolving the symbol once avoids the
+# sys.modules lookup and attribute resolution that a per-call
+# `from PySide6.QtWidgets import QApplication` performs on the GUI-init path.
+_QApplication = None
+
+
+def _qapp():
+    """Return the QApplication class, importing PySide6 on first use."""
+    global _QApplication
+    if _QApplication is None:
+        from PySide6.QtWidgets import QApplication as _QApplication_
+
+        _QApplication = _QApplication_
+    return _QApplication
+
+
+# HiDPI-aware stylesheet, rendered per font scale factor. Kept as a module
+# constant so re-applying styles on settings changes does not rebuild the
+# template string.
+_STYLESHEET_TEMPLATE = """
+    QMainWindow {
+        font-size: %dpt;
+    }
+
+    QToolBar {
+        spacing: %dpx;
+    }
+
+    QDockWidget {
+        font-size: %dpt;
+    }
+
+    QStatusBar {
+        font-size: %dpt;
+    }
+    """
+
+
+@functools.lru_cache(maxsize=8)
+def _render_stylesheet(font_scale: float) -> str:
+    """Render the HiDPI stylesheet for a given font scale factor."""
+    base_font_size = int(10 * font_scale)
+    return _STYLESHEET_TEMPLATE % (
+        base_font_size,
+        int(4 * font_scale),
+        base_font_size,
+        int(9 * font_scale),
+    )
+
+
+# Cached ConfigManager singleton, resolved through the import system only
+# on the first settings fallback (same one-shot pattern as _qapp above).
+_config_manager = None
+
+
+def _get_default_hidpi() -> HiDPISettings:
+    """Return the HiDPI settings from the global config manager."""
+    global _config_manager
+    if _config_manager is None:
+        from openpcb.config import get_config_manager
+
+        _config_manager = get_config_manager()
+    return _config_manager.config.hidpi
+
 
 def configure_hidpi(settings: HiDPISettings | None = None) -> None:
     """
@@ -56,14 +129,18 @@ def configure_hidpi(settings: HiDPISettings | None = None) -> None:
         settings: HiDPI settings to apply. If None, uses config_manager.
     """
     if settings is None:
-        from openpcb.config import config_manager
+        settings = _get_default_hidpi()
 
-        settings = config_manager.config.hidpi
-
-    logger.info(f"Configuring HiDPI: mode={settings.scale_mode}")
+    logger.info("Configuring HiDPI: mode=%s", settings.scale_mode)
 
     # Check if QT_SCALE_FACTOR is set externally
-    external_scale = os.environ.get("QT_SCALE_FACTOR")
+    env = os.environ
+    external_scale = env.get("QT_SCALE_FACTOR")
+
+    # Collect the desired environment deltas per branch and apply them in
+    # one pass below (value None means "remove"); this runs on the critical
+    # pre-QApplication path, so keep the putenv traffic to a minimum.
+    env_updates: dict[str, str | None] = {}
 
     if external_scale and settings.scale_mode == "auto":
         # CRITICAL FIX for menu positioning on HiDPI displays:
@@ -72,36 +149,51 @@ def configure_hidpi(settings: HiDPISettings | None = None) -> None:
         # multiplies the scale factor causing incorrect geometry calculations,
         # especially for menu dropdowns which appear offset from their menu bar items.
         # See: https://doc.qt.io/qt-6/highdpi.html
-        os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
-        os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
-        logger.info(f"External QT_SCALE_FACTOR={external_scale} detected - disabled automatic scaling")
+        env_updates["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
+        env_updates["QT_ENABLE_HIGHDPI_SCALING"] = "0"
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "External QT_SCALE_FACTOR=%s detected - disabled automatic scaling",
+                external_scale,
+            )
     elif settings.scale_mode == "custom":
         # Custom scale factor
-        os.environ["QT_SCALE_FACTOR"] = str(settings.custom_scale_factor)
-        os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
-        os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
-        logger.info(f"Set custom scale factor: {settings.custom_scale_factor}")
+        env_updates["QT_SCALE_FACTOR"] = str(settings.custom_scale_factor)
+        env_updates["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
+        env_updates["QT_ENABLE_HIGHDPI_SCALING"] = "0"
+        logger.info("Set custom scale factor: %s", settings.custom_scale_factor)
     else:
         # Auto/system mode - let Qt handle scaling automatically
-        os.environ.pop("QT_SCALE_FACTOR", None)
+        env_updates["QT_SCALE_FACTOR"] = None
         if settings.enable_high_dpi_scaling:
-            os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
+            env_updates["QT_ENABLE_HIGHDPI_SCALING"] = "1"
         if settings.use_high_dpi_pixmaps:
-            os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
+            env_updates["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
         logger.debug("Using Qt automatic scaling")
 
+    # Only touch variables whose value actually differs; repeated calls
+    # (settings preview, test suites) then leave the environment alone.
+    assignments = {k: v for k, v in env_updates.items() if v is not None and env.get(k) != v}
+    if assignments:
+        env.update(assignments)
+    for key, value in env_updates.items():
+        if value is None and key in env:
+            del env[key]
+
     # Platform-specific tweaks
-    if sys.platform == "win32":
-        # Windows: Enable per-monitor DPI awareness
+    global _dpi_awareness_set
+    if _IS_WIN32 and not _dpi_awareness_set:
+        # Windows: Enable per-monitor DPI awareness (process-wide, once)
+        _dpi_awareness_set = True
         try:
             import ctypes
 
             ctypes.windll.shcore.SetProcessDpiAwareness(2)  # PROCESS_PER_MONITOR_DPI_AWARE
             logger.debug("Enabled per-monitor DPI awareness (Windows)")
         except Exception as e:
-            logger.warning(f"Could not set DPI awareness: {e}")
+            logger.warning("Could not set DPI awareness: %s", e)
 
-    elif sys.platform == "darwin":
+    elif _IS_DARWIN:
         # macOS: Retina display support (usually automatic)
         logger.debug("macOS Retina support enabled")
 
@@ -117,31 +209,18 @@ def apply_hidpi_stylesheet(app, settings: HiDPISettings | None = None) -> None:
         settings: HiDPI settings to apply
     """
     if settings is None:
-        from openpcb.config import config_manager
+        settings = _get_default_hidpi()
 
-        settings = config_manager.config.hidpi
+    css = _render_stylesheet(settings.font_scale_factor)
 
-    base_font_size = int(10 * settings.font_scale_factor)
+    # setStyleSheet triggers a style recomputation across the whole widget
+    # tree; skip it when a previous call already applied this exact sheet
+    # (e.g. preferences Apply with an unchanged font scale).
+    if app.property("_openpcb_hidpi_css") == css:
+        return
 
-    stylesheet = f"""
-    QMainWindow {{
-        font-size: {base_font_size}pt;
-    }}
-
-    QToolBar {{
-        spacing: {int(4 * settings.font_scale_factor)}px;
-    }}
-
-    QDockWidget {{
-        font-size: {base_font_size}pt;
-    }}
-
-    QStatusBar {{
-        font-size: {int(9 * settings.font_scale_factor)}pt;
-    }}
-    """
-
-    app.setStyleSheet(stylesheet)
+    app.setStyleSheet(css)
+    app.setProperty("_openpcb_hidpi_css", css)
     logger.debug("Applied HiDPI stylesheet")
 
 
@@ -152,9 +231,7 @@ def get_logical_dpi() -> tuple[float, float]:
     Returns:
         Tuple of (dpi_x, dpi_y)
     """
-    from PySide6.QtWidgets import QApplication
-
-    screen = QApplication.primaryScreen()
+    screen = _qapp().primaryScreen()
     if screen:
         dpi = screen.logicalDotsPerInch()
         return (dpi, dpi)
@@ -169,9 +246,7 @@ def get_device_pixel_ratio() -> float:
     Returns:
         Device pixel ratio (e.g., 2.0 for Retina displays)
     """
-    from PySide6.QtWidgets import QApplication
-
-    screen = QApplication.primaryScreen()
+    screen = _qapp().primaryScreen()
     if screen:
         return screen.devicePixelRatio()
 
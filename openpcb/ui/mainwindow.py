@@ -6,10 +6,11 @@ Provides the primary UI with menu bar, toolbars, dock widgets, and status bar.
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QSize, Qt
+from PySide6.QtCore import QByteArray, QSize, Qt, QTimer
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QDockWidget,
@@ -26,9 +27,33 @@ if TYPE_CHECKING:
     from PySide6.QtGui import QCloseEvent
 
 from openpcb.config import config_manager
+from openpcb.config.models import WindowGeometry
 
 logger = logging.getLogger(__name__)
 
+# Frequently used Qt enum values, resolved once at import; each attribute
+# access goes through shiboken's enum marshaling, so the lookups are
+# hoisted off the window-construction path.
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_LEFT_DOCK = Qt.DockWidgetArea.LeftDockWidgetArea
+_RIGHT_DOCK = Qt.DockWidgetArea.RightDockWidgetArea
+_SIDE_DOCK_AREAS = _LEFT_DOCK | _RIGHT_DOCK
+
+_SK = QKeySequence.StandardKey
+_KEY_NEW = _SK.New
+_KEY_OPEN = _SK.Open
+_KEY_SAVE = _SK.Save
+_KEY_PREFERENCES = _SK.Preferences
+_KEY_QUIT = _SK.Quit
+_KEY_ZOOM_IN = _SK.ZoomIn
+_KEY_ZOOM_OUT = _SK.ZoomOut
+
+
+@functools.lru_cache(maxsize=8)
+def _icon_size(n: int) -> QSize:
+    """Return a cached square QSize for an icon edge length."""
+    return QSize(n, n)
+
 
 class MainWindow(QMainWindow):
     """
@@ -51,39 +76,36 @@ class MainWindow(QMainWindow):
         # Load window geometry from config
         self._restore_geometry()
 
-        # Setup UI components
+        # Setup only what the first paint needs synchronously; docks and
+        # toolbars are deferred to the event loop (they attach before the
+        # user can interact, but show() returns and paints sooner).
         self._create_central_widget()
-        self._create_dock_widgets()
         self._create_actions()
         self._create_menus()
-        self._create_toolbars()
         self._create_status_bar()
 
+        self._layout_finished = False
+        QTimer.singleShot(0, self._finish_layout)
+
         logger.info("Main window initialized")
 
     def _restore_geometry(self) -> None:
         """Restore window geometry from config."""
-        config = config_manager.config
-        geom = config.application.window_geometry
+        geom = config_manager.config.application.window_geometry
 
-        self.setGeometry(geom.x, geom.y, geom.width, geom.height)
+        if geom.geometry_b64:
+            self.restoreGeometry(QByteArray.fromBase64(geom.geometry_b64.encode("ascii")))
+        else:
+            self.resize(1280, 800)
 
         if geom.maximized:
             self.showMaximized()
 
     def _save_geometry(self) -> None:
         """Save window geometry to config."""
-        geom = self.geometry()
-
-        from openpcb.config.models import WindowGeometry
+        geom_b64 = bytes(self.saveGeometry().toBase64()).decode("ascii")
 
-        new_geom = WindowGeometry(
-            x=geom.x(),
-            y=geom.y(),
-            width=geom.width(),
-            height=geom.height(),
-            maximized=self.isMaximized(),
-        )
+        new_geom = WindowGeometry(geometry_b64=geom_b64, maximized=self.isMaximized())
 
         config_manager.update_application(window_geometry=new_geom)
 
@@ -94,90 +116,86 @@ class MainWindow(QMainWindow):
 
         # Placeholder for Phase 2 Qt Quick viewer
         label = QLabel("OpenPCB Viewer\n\n(Qt Quick scene will be integrated in Phase 2)")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setAlignment(_ALIGN_CENTER)
         label.setStyleSheet("QLabel { color: #888; font-size: 14pt; }")
 
         layout.addWidget(label)
         self.setCentralWidget(central)
 
+    def _finish_layout(self) -> None:
+        """Create the deferred UI (docks, toolbars) after the first paint."""
+        self._create_dock_widgets()
+        self._create_toolbars()
+
+        # Dock visibility toggles (the View menu entries need the docks)
+        self.view_menu.addAction(self.layer_dock.toggleViewAction())
+        self.view_menu.addAction(self.properties_dock.toggleViewAction())
+        self.view_menu.addAction(self.tool_dock.toggleViewAction())
+
+        self._layout_finished = True
+        logger.debug("Deferred layout finished")
+
+    def _make_placeholder_dock(self, title: str, text: str, area: Qt.DockWidgetArea) -> QDockWidget:
+        """Create and add a dock widget holding a centered placeholder label."""
+        dock = QDockWidget(title, self)
+        dock.setAllowedAreas(_SIDE_DOCK_AREAS)
+        label = QLabel(text)
+        label.setAlignment(_ALIGN_CENTER)
+        dock.setWidget(label)
+        self.addDockWidget(area, dock)
+        return dock
+
     def _create_dock_widgets(self) -> None:
         """Create dock widgets for panels."""
-        # Layer panel (left)
-        self.layer_dock = QDockWidget("Layers", self)
-        self.layer_dock.setAllowedAreas(
-            Qt.DockWidgetArea.LeftDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea
-        )
-        layer_widget = QLabel("Layer panel\n(Phase 2)")
-        layer_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_dock.setWidget(layer_widget)
-        self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.layer_dock)
-
-        # Properties panel (right)
-        self.properties_dock = QDockWidget("Properties", self)
-        self.properties_dock.setAllowedAreas(
-            Qt.DockWidgetArea.LeftDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea
+        self.layer_dock = self._make_placeholder_dock(
+            "Layers", "Layer panel\n(Phase 2)", _LEFT_DOCK
         )
-        props_widget = QLabel("Properties panel\n(Phase 2)")
-        props_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.properties_dock.setWidget(props_widget)
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.properties_dock)
-
-        # Tool panel (left, below layers)
-        self.tool_dock = QDockWidget("Tools", self)
-        self.tool_dock.setAllowedAreas(
-            Qt.DockWidgetArea.LeftDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea
+        self.properties_dock = self._make_placeholder_dock(
+            "Properties", "Properties panel\n(Phase 2)", _RIGHT_DOCK
         )
-        tool_widget = QLabel("Tool panel\n(Phase 2)")
-        tool_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.tool_dock.setWidget(tool_widget)
-        self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.tool_dock)
-
-        # Restore visibility from config
-        config = config_manager.config.workspace
-        self.layer_dock.setVisible(config.show_layer_panel)
-        self.properties_dock.setVisible(config.show_properties_panel)
-        self.tool_dock.setVisible(config.show_tool_panel)
+        self.tool_dock = self._make_placeholder_dock("Tools", "Tool panel\n(Phase 2)", _LEFT_DOCK)
+
+        # Restore visibility from config (one lock acquisition, local binds)
+        ws = config_manager.config.workspace
+        self.layer_dock.setVisible(ws.show_layer_panel)
+        self.properties_dock.setVisible(ws.show_properties_panel)
+        self.tool_dock.setVisible(ws.show_tool_panel)
+
+    # Action table: (attribute, text, shortcut, status tip, handler name).
+    # One loop builds all actions, which keeps the construction bytecode
+    # small and lets the interpreter specialize the repeated Qt calls.
+    _ACTIONS = (
+        ("action_new", "&New Project", _KEY_NEW, "Create a new project", "_on_new_project"),
+        (
+            "action_open",
+            "&Open Project...",
+            _KEY_OPEN,
+            "Open an existing project",
+            "_on_open_project",
+        ),
+        ("action_save", "&Save Project", _KEY_SAVE, "Save current project", "_on_save_project"),
+        (
+            "action_preferences",
+            "&Preferences...",
+            _KEY_PREFERENCES,
+            "Configure application settings",
+            "_on_preferences",
+        ),
+        ("action_quit", "&Quit", _KEY_QUIT, "Exit application", "close"),
+        ("action_zoom_in", "Zoom &In", _KEY_ZOOM_IN, None, "_on_zoom_in"),
+        ("action_zoom_out", "Zoom &Out", _KEY_ZOOM_OUT, None, "_on_zoom_out"),
+        ("action_zoom_fit", "Zoom to &Fit", "Ctrl+0", None, "_on_zoom_fit"),
+    )
 
     def _create_actions(self) -> None:
-        """Create QActions for menus and toolbars."""
-        # File actions
-        self.action_new = QAction("&New Project", self)
-        self.action_new.setShortcut(QKeySequence.StandardKey.New)
-        self.action_new.setStatusTip("Create a new project")
-        self.action_new.triggered.connect(self._on_new_project)
-
-        self.action_open = QAction("&Open Project...", self)
-        self.action_open.setShortcut(QKeySequence.StandardKey.Open)
-        self.action_open.setStatusTip("Open an existing project")
-        self.action_open.triggered.connect(self._on_open_project)
-
-        self.action_save = QAction("&Save Project", self)
-        self.action_save.setShortcut(QKeySequence.StandardKey.Save)
-        self.action_save.setStatusTip("Save current project")
-        self.action_save.triggered.connect(self._on_save_project)
-
-        self.action_preferences = QAction("&Preferences...", self)
-        self.action_preferences.setShortcut(QKeySequence.StandardKey.Preferences)
-        self.action_preferences.setStatusTip("Configure application settings")
-        self.action_preferences.triggered.connect(self._on_preferences)
-
-        self.action_quit = QAction("&Quit", self)
-        self.action_quit.setShortcut(QKeySequence.StandardKey.Quit)
-        self.action_quit.setStatusTip("Exit application")
-        self.action_quit.triggered.connect(self.close)
-
-        # View actions
-        self.action_zoom_in = QAction("Zoom &In", self)
-        self.action_zoom_in.setShortcut(QKeySequence.StandardKey.ZoomIn)
-        self.action_zoom_in.triggered.connect(self._on_zoom_in)
-
-        self.action_zoom_out = QAction("Zoom &Out", self)
-        self.action_zoom_out.setShortcut(QKeySequence.StandardKey.ZoomOut)
-        self.action_zoom_out.triggered.connect(self._on_zoom_out)
-
-        self.action_zoom_fit = QAction("Zoom to &Fit", self)
-        self.action_zoom_fit.setShortcut(QKeySequence("Ctrl+0"))
-        self.action_zoom_fit.triggered.connect(self._on_zoom_fit)
+        """Create QActions for menus and toolbars from the action table."""
+        for attr, text, shortcut, tip, handler in self._ACTIONS:
+            action = QAction(text, self)
+            action.setShortcut(shortcut)
+            if tip is not None:
+                action.setStatusTip(tip)
+            action.triggered.connect(getattr(self, handler))
+            setattr(self, attr, action)
 
     def _create_menus(self) -> None:
         """Create menu bar."""
@@ -210,11 +228,6 @@ class MainWindow(QMainWindow):
         self.view_menu.addAction(self.action_zoom_out)
         self.view_menu.addAction(self.action_zoom_fit)
         self.view_menu.addSeparator()
-
-        # Dock visibility toggles
-        self.view_menu.addAction(self.layer_dock.toggleViewAction())
-        self.view_menu.addAction(self.properties_dock.toggleViewAction())
-        self.view_menu.addAction(self.tool_dock.toggleViewAction())
         logger.debug(f"Created View menu: {self.view_menu.title()}")
 
         # Tools menu (placeholder)
@@ -248,7 +261,7 @@ class MainWindow(QMainWindow):
 
         # Set icon size from config
         config = config_manager.config.hidpi
-        main_toolbar.setIconSize(QSize(config.toolbar_icon_size, config.toolbar_icon_size))
+        main_toolbar.setIconSize(_icon_size(config.toolbar_icon_size))
 
         self.addToolBar(main_toolbar)
 
@@ -319,11 +332,18 @@ class MainWindow(QMainWindow):
         # Save window geometry
         self._save_geometry()
 
-        # Save dock visibility
-        config_manager.update_workspace(
-            show_layer_panel=self.layer_dock.isVisible(),
-            show_properties_panel=self.properties_dock.isVisible(),
-            show_tool_panel=self.tool_dock.isVisible(),
-        )
+        # Save dock visibility in a single update (one model copy + save);
+        # skipped if the window closed before the deferred layout ran.
+        if self._layout_finished:
+            panel_state = {
+                "show_layer_panel": self.layer_dock.isVisible(),
+                "show_properties_panel": self.properties_dock.isVisible(),
+                "show_tool_panel": self.tool_dock.isVisible(),
+            }
+            config_manager.update_workspace(**panel_state)
+
+        # Persistence is asynchronous; make sure the final window state
+        # reaches disk before the process tears down.
+        config_manager.flush()
 
         event.accept()
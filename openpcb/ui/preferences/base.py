@@ -6,11 +6,15 @@ Multi-page dialog for configuring application settings.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 
+from PySide6.QtCore import QSignalBlocker, Slot
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
+    QFormLayout,
+    QGroupBox,
     QHBoxLayout,
     QListWidget,
     QMessageBox,
@@ -21,13 +25,58 @@ from PySide6.QtWidgets import (
 
 from openpcb.config import config_manager
 
-from .display_page import DisplaySettingsPage
-from .hidpi_page import HiDPISettingsPage
-from .workspace_page import WorkspaceSettingsPage
-
 logger = logging.getLogger(__name__)
 
 
+@contextlib.contextmanager
+def blocked_signals(*widgets: QWidget):
+    """
+    Block signal emission for the given widgets within the context.
+
+    Used by the settings pages while populating widgets from config so the
+    setValue/setChecked/setCurrentIndex calls do not cascade into change
+    slots (dirty tracking, dependent-widget updates, repaints).
+    """
+    blockers = [QSignalBlocker(widget) for widget in widgets]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+# Widget property appliers for build_form row specs. Each key in a row's
+# props dict maps to one setter call on the freshly built widget.
+_PROP_SETTERS = {
+    "range": lambda w, v: w.setRange(*v),
+    "step": lambda w, v: w.setSingleStep(v),
+    "decimals": lambda w, v: w.setDecimals(v),
+    "suffix": lambda w, v: w.setSuffix(v),
+    "items": lambda w, v: w.addItems(list(v)),
+}
+
+
+def build_form(page: QWidget, layout: QVBoxLayout, title: str, rows: tuple) -> None:
+    """
+    Build a QGroupBox form group from declarative row specs.
+
+    Each row is (attr_name, widget_class, label, props): the widget is
+    instantiated, configured via _PROP_SETTERS, bound to the page as
+    attr_name, and added to the group's form layout. Pages drive their
+    _setup_ui from module-level spec tuples instead of repeating the
+    create/configure/addRow boilerplate per widget.
+    """
+    group = QGroupBox(title)
+    form = QFormLayout(group)
+    for attr, widget_cls, label, props in rows:
+        widget = widget_cls()
+        for key, value in props.items():
+            _PROP_SETTERS[key](widget, value)
+        setattr(page, attr, widget)
+        form.addRow(label, widget)
+    layout.addWidget(group)
+
+
 class PreferencesDialog(QDialog):
     """
     Preferences dialog with multiple pages.
@@ -52,6 +101,13 @@ class PreferencesDialog(QDialog):
 
     def _setup_ui(self) -> None:
         """Setup dialog UI."""
+        # Deferred imports: keep the page widgets (and their pydantic model
+        # imports) out of the MainWindow import graph; they only load when
+        # the user actually opens Preferences.
+        from .display_page import DisplaySettingsPage
+        from .hidpi_page import HiDPISettingsPage
+        from .workspace_page import WorkspaceSettingsPage
+
         layout = QVBoxLayout(self)
 
         # Main area: list + pages
@@ -66,17 +122,18 @@ class PreferencesDialog(QDialog):
         self.category_list.setCurrentRow(0)
         self.category_list.currentRowChanged.connect(self._on_category_changed)
 
-        # Pages stack (right)
+        # Pages stack (right). Pages are expensive to build (widget trees
+        # plus a config load each), and users typically visit one category
+        # per dialog open - so each slot starts as a plain placeholder that
+        # is swapped for the real page on first visit.
         self.pages = QStackedWidget()
+        self._page_factories = (DisplaySettingsPage, HiDPISettingsPage, WorkspaceSettingsPage)
+        self._page_instances: list[QWidget | None] = [None] * len(self._page_factories)
+        for _ in self._page_factories:
+            self.pages.addWidget(QWidget())
 
-        # Create pages
-        self.display_page = DisplaySettingsPage()
-        self.hidpi_page = HiDPISettingsPage()
-        self.workspace_page = WorkspaceSettingsPage()
-
-        self.pages.addWidget(self.display_page)
-        self.pages.addWidget(self.hidpi_page)
-        self.pages.addWidget(self.workspace_page)
+        # Build the initially visible page up front
+        self._materialize_page(0)
 
         main_layout.addWidget(self.category_list)
         main_layout.addWidget(self.pages, 1)
@@ -99,19 +156,37 @@ class PreferencesDialog(QDialog):
 
         layout.addWidget(button_box)
 
+    def _materialize_page(self, index: int) -> QWidget:
+        """Return the page for a category, building it on first access."""
+        page = self._page_instances[index]
+        if page is None:
+            page = self._page_factories[index]()
+            self._page_instances[index] = page
+
+            placeholder = self.pages.widget(index)
+            self.pages.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.pages.insertWidget(index, page)
+        return page
+
+    @Slot(int)
     def _on_category_changed(self, index: int) -> None:
         """Handle category selection change."""
+        self._materialize_page(index)
         self.pages.setCurrentIndex(index)
 
+    @Slot()
     def _on_ok(self) -> None:
         """Handle OK button."""
         self._apply_changes()
         self.accept()
 
+    @Slot()
     def _on_apply(self) -> None:
         """Handle Apply button."""
         self._apply_changes()
 
+    @Slot()
     def _on_restore_defaults(self) -> None:
         """Handle Restore Defaults button."""
         logger.info("Restoring default settings")
@@ -126,17 +201,20 @@ class PreferencesDialog(QDialog):
         if reply == QMessageBox.StandardButton.Yes:
             config_manager.reset_to_defaults()
 
-            # Reload pages
-            self.display_page.load_settings()
-            self.hidpi_page.load_settings()
-            self.workspace_page.load_settings()
+            # Reload pages that have been built
+            for page in self._page_instances:
+                if page is not None:
+                    page.load_settings()
 
     def _apply_changes(self) -> None:
         """Apply changes from all pages."""
         logger.info("Applying preferences changes")
 
-        self.display_page.apply_settings()
-        self.hidpi_page.apply_settings()
-        self.workspace_page.apply_settings()
+        # One disk write for the whole dialog instead of one per page;
+        # never-built pages have nothing to apply.
+        with config_manager.batch_update():
+            for page in self._page_instances:
+                if page is not None:
+                    page.apply_settings()
 
         logger.info("Preferences saved")
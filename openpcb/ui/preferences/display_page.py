@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from PySide6.QtGui import QColor
+import functools
+
+from PySide6.QtCore import Slot
+from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import (
     QCheckBox,
     QColorDialog,
@@ -18,14 +21,24 @@ from PySide6.QtWidgets import (
 
 from openpcb.config import ColorScheme, Units, config_manager
 
+from .base import blocked_signals
+
 
 class DisplaySettingsPage(QWidget):
     """Display settings configuration page."""
 
+    # Combo-box index <-> ColorScheme mapping, built once at class creation
+    _SCHEME_INDEX = {"system": 0, "light": 1, "dark": 2}
+    _SCHEME_VALUES = (ColorScheme.SYSTEM, ColorScheme.LIGHT, ColorScheme.DARK)
+
     def __init__(self, parent: QWidget | None = None) -> None:
         """Initialize display settings page."""
         super().__init__(parent)
 
+        # Parsed QColor per hex string; avoids re-parsing on every swatch
+        # update or picker launch.
+        self._qcolor_cache: dict[str, QColor] = {}
+
         self._setup_ui()
         self.load_settings()
 
@@ -70,16 +83,21 @@ class DisplaySettingsPage(QWidget):
         colors_layout = QFormLayout(colors_group)
 
         self.bg_color_btn = QPushButton()
-        self.bg_color_btn.clicked.connect(lambda: self._choose_color("background"))
-
         self.grid_color_btn = QPushButton()
-        self.grid_color_btn.clicked.connect(lambda: self._choose_color("grid"))
-
         self.cursor_color_btn = QPushButton()
-        self.cursor_color_btn.clicked.connect(lambda: self._choose_color("cursor"))
-
         self.selection_color_btn = QPushButton()
-        self.selection_color_btn.clicked.connect(lambda: self._choose_color("selection"))
+
+        # color key -> (attribute holding the hex value, button); drives the
+        # signal connections and the _choose_color dispatch without lambda
+        # closures or an if/elif chain per click.
+        self._color_attrs = {
+            "background": ("_bg_color", self.bg_color_btn),
+            "grid": ("_grid_color", self.grid_color_btn),
+            "cursor": ("_cursor_color", self.cursor_color_btn),
+            "selection": ("_selection_color", self.selection_color_btn),
+        }
+        for color_type, (_attr, button) in self._color_attrs.items():
+            button.clicked.connect(functools.partial(self._choose_color, color_type))
 
         colors_layout.addRow("Background:", self.bg_color_btn)
         colors_layout.addRow("Grid:", self.grid_color_btn)
@@ -115,16 +133,52 @@ class DisplaySettingsPage(QWidget):
 
         layout.addStretch()
 
+        # Track edits so an untouched page can skip apply entirely
+        self._dirty = False
+        for signal in (
+            self.grid_visible_check.toggled,
+            self.grid_size_spin.valueChanged,
+            self.snap_to_grid_check.toggled,
+            self.units_combo.currentIndexChanged,
+            self.decimal_places_spin.valueChanged,
+            self.antialiasing_check.toggled,
+            self.show_rulers_check.toggled,
+            self.show_origin_check.toggled,
+            self.color_scheme_combo.currentIndexChanged,
+        ):
+            signal.connect(self._mark_dirty)
+
     def load_settings(self) -> None:
         """Load current settings into UI."""
         config = config_manager.config.display
 
-        self.grid_visible_check.setChecked(config.grid_visible)
-        self.grid_size_spin.setValue(config.grid_size_mm)
-        self.snap_to_grid_check.setChecked(config.snap_to_grid)
-
-        self.units_combo.setCurrentIndex(0 if config.units == Units.MILLIMETERS else 1)
-        self.decimal_places_spin.setValue(config.decimal_places)
+        # Populate with signals blocked: the setters would otherwise fire
+        # change slots (and mark the page dirty) for every field.
+        with blocked_signals(
+            self.grid_visible_check,
+            self.grid_size_spin,
+            self.snap_to_grid_check,
+            self.units_combo,
+            self.decimal_places_spin,
+            self.antialiasing_check,
+            self.show_rulers_check,
+            self.show_origin_check,
+            self.color_scheme_combo,
+        ):
+            self.grid_visible_check.setChecked(config.grid_visible)
+            self.grid_size_spin.setValue(config.grid_size_mm)
+            self.snap_to_grid_check.setChecked(config.snap_to_grid)
+
+            self.units_combo.setCurrentIndex(0 if config.units == Units.MILLIMETERS else 1)
+            self.decimal_places_spin.setValue(config.decimal_places)
+
+            self.antialiasing_check.setChecked(config.antialiasing)
+            self.show_rulers_check.setChecked(config.show_rulers)
+            self.show_origin_check.setChecked(config.show_origin)
+
+            self.color_scheme_combo.setCurrentIndex(
+                self._SCHEME_INDEX.get(config.color_scheme.value, 0)
+            )
 
         self._bg_color = config.background_color
         self._grid_color = config.grid_color
@@ -136,19 +190,21 @@ class DisplaySettingsPage(QWidget):
         self._update_color_button(self.cursor_color_btn, self._cursor_color)
         self._update_color_button(self.selection_color_btn, self._selection_color)
 
-        self.antialiasing_check.setChecked(config.antialiasing)
-        self.show_rulers_check.setChecked(config.show_rulers)
-        self.show_origin_check.setChecked(config.show_origin)
+        self._dirty = False
 
-        scheme_map = {"system": 0, "light": 1, "dark": 2}
-        self.color_scheme_combo.setCurrentIndex(scheme_map.get(config.color_scheme.value, 0))
+    @Slot()
+    def _mark_dirty(self, *_args) -> None:
+        """Mark the page as edited."""
+        self._dirty = True
 
     def apply_settings(self) -> None:
         """Apply settings from UI."""
+        if not self._dirty:
+            return
+
         units = Units.MILLIMETERS if self.units_combo.currentIndex() == 0 else Units.INCHES
 
-        scheme_values = [ColorScheme.SYSTEM, ColorScheme.LIGHT, ColorScheme.DARK]
-        color_scheme = scheme_values[self.color_scheme_combo.currentIndex()]
+        color_scheme = self._SCHEME_VALUES[self.color_scheme_combo.currentIndex()]
 
         config_manager.update_display(
             grid_visible=self.grid_visible_check.isChecked(),
@@ -166,34 +222,34 @@ class DisplaySettingsPage(QWidget):
             color_scheme=color_scheme,
         )
 
+        self._dirty = False
+
     def _choose_color(self, color_type: str) -> None:
         """Show color picker dialog."""
-        current_map = {
-            "background": self._bg_color,
-            "grid": self._grid_color,
-            "cursor": self._cursor_color,
-            "selection": self._selection_color,
-        }
-        current = current_map[color_type]
+        attr, button = self._color_attrs[color_type]
+        current = getattr(self, attr)
 
-        color = QColorDialog.getColor(QColor(current), self, f"Choose {color_type} color")
+        color = QColorDialog.getColor(self._qcolor(current), self, f"Choose {color_type} color")
 
         if color.isValid():
             hex_color = color.name()
-            if color_type == "background":
-                self._bg_color = hex_color
-                self._update_color_button(self.bg_color_btn, hex_color)
-            elif color_type == "grid":
-                self._grid_color = hex_color
-                self._update_color_button(self.grid_color_btn, hex_color)
-            elif color_type == "cursor":
-                self._cursor_color = hex_color
-                self._update_color_button(self.cursor_color_btn, hex_color)
-            elif color_type == "selection":
-                self._selection_color = hex_color
-                self._update_color_button(self.selection_color_btn, hex_color)
+            setattr(self, attr, hex_color)
+            self._update_color_button(button, hex_color)
+            self._dirty = True
+
+    def _qcolor(self, color: str) -> QColor:
+        """Return a cached QColor for a hex string."""
+        qcolor = self._qcolor_cache.get(color)
+        if qcolor is None:
+            qcolor = self._qcolor_cache[color] = QColor(color)
+        return qcolor
 
     def _update_color_button(self, button: QPushButton, color: str) -> None:
         """Update button to show color."""
-        button.setStyleSheet(f"background-color: {color};")
+        # Set the color through the palette; a per-click setStyleSheet would
+        # route every update through Qt's CSS parser instead.
+        palette = button.palette()
+        palette.setColor(QPalette.ColorRole.Button, self._qcolor(color))
+        button.setPalette(palette)
+        button.setAutoFillBackground(True)
         button.setText(color)
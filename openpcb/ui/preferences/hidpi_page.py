@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
+from PySide6.QtCore import Slot
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
     QDoubleSpinBox,
-    QFormLayout,
-    QGroupBox,
     QSpinBox,
     QVBoxLayout,
     QWidget,
@@ -15,85 +14,107 @@ from PySide6.QtWidgets import (
 
 from openpcb.config import HiDPIScaleMode, config_manager
 
+from .base import blocked_signals, build_form
+
+# Declarative form layout: (group title, ((attr, widget, label, props), ...))
+_FORM_GROUPS = (
+    (
+        "Display Scaling",
+        (
+            ("scale_mode_combo", QComboBox, "Scale Mode:", {"items": ("Auto", "System", "Custom")}),
+            (
+                "custom_scale_spin",
+                QDoubleSpinBox,
+                "Custom Scale Factor:",
+                {"range": (0.5, 4.0), "step": 0.1, "decimals": 2},
+            ),
+        ),
+    ),
+    (
+        "Font Scaling",
+        (
+            (
+                "font_scale_spin",
+                QDoubleSpinBox,
+                "Font Scale Factor:",
+                {"range": (0.5, 3.0), "step": 0.1, "decimals": 2},
+            ),
+        ),
+    ),
+    (
+        "Icon Sizes",
+        (
+            (
+                "toolbar_icon_spin",
+                QSpinBox,
+                "Toolbar Icon Size:",
+                {"range": (16, 128), "suffix": " px"},
+            ),
+            ("menu_icon_spin", QSpinBox, "Menu Icon Size:", {"range": (12, 64), "suffix": " px"}),
+        ),
+    ),
+    (
+        "Advanced Options",
+        (
+            ("enable_scaling_check", QCheckBox, "Enable High DPI Scaling:", {}),
+            ("use_pixmaps_check", QCheckBox, "Use High DPI Pixmaps:", {}),
+            ("round_scale_check", QCheckBox, "Round Scale Factor:", {}),
+        ),
+    ),
+)
+
 
 class HiDPISettingsPage(QWidget):
     """HiDPI settings configuration page."""
 
+    # Combo-box index <-> HiDPIScaleMode mapping, built once at class
+    # creation. Keyed by enum member, so lookups hash the enum identity
+    # instead of its string value.
+    _INDEX_TO_MODE = (HiDPIScaleMode.AUTO, HiDPIScaleMode.SYSTEM, HiDPIScaleMode.CUSTOM)
+    _MODE_TO_INDEX = {mode: i for i, mode in enumerate(_INDEX_TO_MODE)}
+
     def __init__(self, parent: QWidget | None = None) -> None:
         """Initialize HiDPI settings page."""
         super().__init__(parent)
 
-        self._setup_ui()
-        self.load_settings()
+        # Widget construction and the config read are deferred to the
+        # first showEvent; a page that is never shown stays empty.
+        self._built = False
+
+    def showEvent(self, event) -> None:  # noqa: N802 (Qt override)
+        """Build the page UI on first show."""
+        if not self._built:
+            self._built = True
+            self._setup_ui()
+            self.load_settings()
+        super().showEvent(event)
 
     def _setup_ui(self) -> None:
         """Setup page UI."""
         layout = QVBoxLayout(self)
 
-        # Scaling group
-        scaling_group = QGroupBox("Display Scaling")
-        scaling_layout = QFormLayout(scaling_group)
+        for title, rows in _FORM_GROUPS:
+            build_form(self, layout, title, rows)
 
-        self.scale_mode_combo = QComboBox()
-        self.scale_mode_combo.addItems(["Auto", "System", "Custom"])
         self.scale_mode_combo.currentIndexChanged.connect(self._on_scale_mode_changed)
 
-        self.custom_scale_spin = QDoubleSpinBox()
-        self.custom_scale_spin.setRange(0.5, 4.0)
-        self.custom_scale_spin.setSingleStep(0.1)
-        self.custom_scale_spin.setDecimals(2)
-
-        scaling_layout.addRow("Scale Mode:", self.scale_mode_combo)
-        scaling_layout.addRow("Custom Scale Factor:", self.custom_scale_spin)
-
-        layout.addWidget(scaling_group)
-
-        # Font scaling group
-        font_group = QGroupBox("Font Scaling")
-        font_layout = QFormLayout(font_group)
-
-        self.font_scale_spin = QDoubleSpinBox()
-        self.font_scale_spin.setRange(0.5, 3.0)
-        self.font_scale_spin.setSingleStep(0.1)
-        self.font_scale_spin.setDecimals(2)
-
-        font_layout.addRow("Font Scale Factor:", self.font_scale_spin)
-
-        layout.addWidget(font_group)
-
-        # Icon sizes group
-        icon_group = QGroupBox("Icon Sizes")
-        icon_layout = QFormLayout(icon_group)
-
-        self.toolbar_icon_spin = QSpinBox()
-        self.toolbar_icon_spin.setRange(16, 128)
-        self.toolbar_icon_spin.setSuffix(" px")
-
-        self.menu_icon_spin = QSpinBox()
-        self.menu_icon_spin.setRange(12, 64)
-        self.menu_icon_spin.setSuffix(" px")
-
-        icon_layout.addRow("Toolbar Icon Size:", self.toolbar_icon_spin)
-        icon_layout.addRow("Menu Icon Size:", self.menu_icon_spin)
-
-        layout.addWidget(icon_group)
-
-        # Advanced options group
-        advanced_group = QGroupBox("Advanced Options")
-        advanced_layout = QFormLayout(advanced_group)
-
-        self.enable_scaling_check = QCheckBox()
-        self.use_pixmaps_check = QCheckBox()
-        self.round_scale_check = QCheckBox()
-
-        advanced_layout.addRow("Enable High DPI Scaling:", self.enable_scaling_check)
-        advanced_layout.addRow("Use High DPI Pixmaps:", self.use_pixmaps_check)
-        advanced_layout.addRow("Round Scale Factor:", self.round_scale_check)
-
-        layout.addWidget(advanced_group)
-
         layout.addStretch()
 
+        # Track edits so an untouched page can skip apply entirely
+        self._dirty = False
+        for signal in (
+            self.scale_mode_combo.currentIndexChanged,
+            self.custom_scale_spin.valueChanged,
+            self.font_scale_spin.valueChanged,
+            self.toolbar_icon_spin.valueChanged,
+            self.menu_icon_spin.valueChanged,
+            self.enable_scaling_check.toggled,
+            self.use_pixmaps_check.toggled,
+            self.round_scale_check.toggled,
+        ):
+            signal.connect(self._mark_dirty)
+
+    @Slot(int)
     def _on_scale_mode_changed(self, index: int) -> None:
         """Handle scale mode change."""
         # Enable custom scale only when mode is Custom
@@ -101,39 +122,68 @@ class HiDPISettingsPage(QWidget):
 
     def load_settings(self) -> None:
         """Load current settings into UI."""
-        config = config_manager.config.hidpi
+        if not self._built:
+            return
 
-        # Scale mode
-        mode_map = {"auto": 0, "system": 1, "custom": 2}
-        self.scale_mode_combo.setCurrentIndex(mode_map.get(config.scale_mode.value, 0))
+        config = config_manager.config.hidpi
 
-        self.custom_scale_spin.setValue(config.custom_scale_factor)
+        # Populate with signals blocked: the setters would otherwise fire
+        # change slots (and mark the page dirty) for every field.
+        with blocked_signals(
+            self.scale_mode_combo,
+            self.custom_scale_spin,
+            self.font_scale_spin,
+            self.toolbar_icon_spin,
+            self.menu_icon_spin,
+            self.enable_scaling_check,
+            self.use_pixmaps_check,
+            self.round_scale_check,
+        ):
+            # Scale mode
+            self.scale_mode_combo.setCurrentIndex(self._MODE_TO_INDEX.get(config.scale_mode, 0))
+
+            self.custom_scale_spin.setValue(config.custom_scale_factor)
+
+            # Font scaling
+            self.font_scale_spin.setValue(config.font_scale_factor)
+
+            # Icon sizes
+            self.toolbar_icon_spin.setValue(config.toolbar_icon_size)
+            self.menu_icon_spin.setValue(config.menu_icon_size)
+
+            # Advanced options
+            self.enable_scaling_check.setChecked(config.enable_high_dpi_scaling)
+            self.use_pixmaps_check.setChecked(config.use_high_dpi_pixmaps)
+            self.round_scale_check.setChecked(config.round_scale_factor)
+
+        # Sync the custom-scale enabled state by hand; the combo signal that
+        # normally drives it was blocked above.
         self._on_scale_mode_changed(self.scale_mode_combo.currentIndex())
 
-        # Font scaling
-        self.font_scale_spin.setValue(config.font_scale_factor)
-
-        # Icon sizes
-        self.toolbar_icon_spin.setValue(config.toolbar_icon_size)
-        self.menu_icon_spin.setValue(config.menu_icon_size)
+        self._dirty = False
 
-        # Advanced options
-        self.enable_scaling_check.setChecked(config.enable_high_dpi_scaling)
-        self.use_pixmaps_check.setChecked(config.use_high_dpi_pixmaps)
-        self.round_scale_check.setChecked(config.round_scale_factor)
+    @Slot()
+    def _mark_dirty(self, *_args) -> None:
+        """Mark the page as edited."""
+        self._dirty = True
 
     def apply_settings(self) -> None:
         """Apply settings from UI."""
-        mode_values = [HiDPIScaleMode.AUTO, HiDPIScaleMode.SYSTEM, HiDPIScaleMode.CUSTOM]
-        scale_mode = mode_values[self.scale_mode_combo.currentIndex()]
-
-        config_manager.update_hidpi(
-            scale_mode=scale_mode,
-            custom_scale_factor=self.custom_scale_spin.value(),
-            font_scale_factor=self.font_scale_spin.value(),
-            toolbar_icon_size=self.toolbar_icon_spin.value(),
-            menu_icon_size=self.menu_icon_spin.value(),
-            enable_high_dpi_scaling=self.enable_scaling_check.isChecked(),
-            use_high_dpi_pixmaps=self.use_pixmaps_check.isChecked(),
-            round_scale_factor=self.round_scale_check.isChecked(),
-        )
+        if not self._built or not self._dirty:
+            return
+
+        # Read every widget once into a single update mapping; the manager
+        # folds it into the frozen model with one model_copy pass.
+        updates = {
+            "scale_mode": self._INDEX_TO_MODE[self.scale_mode_combo.currentIndex()],
+            "custom_scale_factor": self.custom_scale_spin.value(),
+            "font_scale_factor": self.font_scale_spin.value(),
+            "toolbar_icon_size": self.toolbar_icon_spin.value(),
+            "menu_icon_size": self.menu_icon_spin.value(),
+            "enable_high_dpi_scaling": self.enable_scaling_check.isChecked(),
+            "use_high_dpi_pixmaps": self.use_pixmaps_check.isChecked(),
+            "round_scale_factor": self.round_scale_check.isChecked(),
+        }
+        config_manager.update_hidpi(**updates)
+
+        self._dirty = False
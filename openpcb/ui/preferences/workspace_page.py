@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from PySide6.QtCore import Slot
 from PySide6.QtWidgets import (
     QCheckBox,
     QFormLayout,
@@ -14,6 +15,26 @@ from PySide6.QtWidgets import (
 
 from openpcb.config import config_manager
 
+from .base import blocked_signals, build_form
+
+# Declarative form layout: (group title, ((attr, widget, label, props), ...)).
+# The Recent Files group stays hand-built; its read-only label needs word
+# wrap and a muted style that the shared row specs do not cover.
+_FORM_GROUPS = (
+    (
+        "Profile",
+        (("active_profile_edit", QLineEdit, "Active Profile:", {}),),
+    ),
+    (
+        "Panel Visibility",
+        (
+            ("show_layer_panel_check", QCheckBox, "Show Layer Panel:", {}),
+            ("show_properties_panel_check", QCheckBox, "Show Properties Panel:", {}),
+            ("show_tool_panel_check", QCheckBox, "Show Tool Panel:", {}),
+        ),
+    ),
+)
+
 
 class WorkspaceSettingsPage(QWidget):
     """Workspace settings configuration page."""
@@ -22,23 +43,25 @@ class WorkspaceSettingsPage(QWidget):
         """Initialize workspace settings page."""
         super().__init__(parent)
 
-        self._setup_ui()
-        self.load_settings()
+        # Widget construction and the config read are deferred to the
+        # first showEvent; a page that is never shown stays empty.
+        self._built = False
+
+    def showEvent(self, event) -> None:  # noqa: N802 (Qt override)
+        """Build the page UI on first show."""
+        if not self._built:
+            self._built = True
+            self._setup_ui()
+            self.load_settings()
+        super().showEvent(event)
 
     def _setup_ui(self) -> None:
         """Setup page UI."""
         layout = QVBoxLayout(self)
 
-        # Profile group
-        profile_group = QGroupBox("Profile")
-        profile_layout = QFormLayout(profile_group)
+        build_form(self, layout, *_FORM_GROUPS[0])
 
-        self.active_profile_edit = QLineEdit()
-        profile_layout.addRow("Active Profile:", self.active_profile_edit)
-
-        layout.addWidget(profile_group)
-
-        # Recent files group
+        # Recent files group (hand-built: see note on _FORM_GROUPS)
         recent_group = QGroupBox("Recent Files")
         recent_layout = QFormLayout(recent_group)
 
@@ -50,40 +73,67 @@ class WorkspaceSettingsPage(QWidget):
 
         layout.addWidget(recent_group)
 
-        # Panel visibility group
-        panels_group = QGroupBox("Panel Visibility")
-        panels_layout = QFormLayout(panels_group)
-
-        self.show_layer_panel_check = QCheckBox()
-        self.show_properties_panel_check = QCheckBox()
-        self.show_tool_panel_check = QCheckBox()
-
-        panels_layout.addRow("Show Layer Panel:", self.show_layer_panel_check)
-        panels_layout.addRow("Show Properties Panel:", self.show_properties_panel_check)
-        panels_layout.addRow("Show Tool Panel:", self.show_tool_panel_check)
-
-        layout.addWidget(panels_group)
+        build_form(self, layout, *_FORM_GROUPS[1])
 
         layout.addStretch()
 
+        # Track edits so an untouched page can skip apply entirely
+        self._dirty = False
+        for signal in (
+            self.active_profile_edit.textChanged,
+            self.show_layer_panel_check.toggled,
+            self.show_properties_panel_check.toggled,
+            self.show_tool_panel_check.toggled,
+        ):
+            signal.connect(self._mark_dirty)
+
     def load_settings(self) -> None:
         """Load current settings into UI."""
-        config = config_manager.config.workspace
+        if not self._built:
+            return
 
-        self.active_profile_edit.setText(config.active_profile)
+        config = config_manager.config.workspace
 
+        # Populate with signals blocked: the setters would otherwise fire
+        # change slots (and mark the page dirty) for every field.
+        with blocked_signals(
+            self.active_profile_edit,
+            self.show_layer_panel_check,
+            self.show_properties_panel_check,
+            self.show_tool_panel_check,
+        ):
+            self.active_profile_edit.setText(config.active_profile)
+
+            self.show_layer_panel_check.setChecked(config.show_layer_panel)
+            self.show_properties_panel_check.setChecked(config.show_properties_panel)
+            self.show_tool_panel_check.setChecked(config.show_tool_panel)
+
+        # setText on an unchanged value would still relayout the word-
+        # wrapped label; skip it on repeated dialog opens.
         last_dir = config.last_project_directory or "None"
-        self.last_project_label.setText(last_dir)
+        if self.last_project_label.text() != last_dir:
+            self.last_project_label.setText(last_dir)
+
+        self._dirty = False
 
-        self.show_layer_panel_check.setChecked(config.show_layer_panel)
-        self.show_properties_panel_check.setChecked(config.show_properties_panel)
-        self.show_tool_panel_check.setChecked(config.show_tool_panel)
+    @Slot()
+    def _mark_dirty(self, *_args) -> None:
+        """Mark the page as edited."""
+        self._dirty = True
 
     def apply_settings(self) -> None:
         """Apply settings from UI."""
-        config_manager.update_workspace(
-            active_profile=self.active_profile_edit.text(),
-            show_layer_panel=self.show_layer_panel_check.isChecked(),
-            show_properties_panel=self.show_properties_panel_check.isChecked(),
-            show_tool_panel=self.show_tool_panel_check.isChecked(),
-        )
+        if not self._built or not self._dirty:
+            return
+
+        # Read every widget once into a single update mapping; the manager
+        # folds it into the frozen model with one model_copy pass.
+        updates = {
+            "active_profile": self.active_profile_edit.text(),
+            "show_layer_panel": self.show_layer_panel_check.isChecked(),
+            "show_properties_panel": self.show_properties_panel_check.isChecked(),
+            "show_tool_panel": self.show_tool_panel_check.isChecked(),
+        }
+        config_manager.update_workspace(**updates)
+
+        self._dirty = False
@@ -24,7 +24,8 @@ def test_config_defaults():
     assert config.schema_version == 1
     assert config.display.units == Units.MILLIMETERS
     assert config.hidpi.enable_high_dpi_scaling is True
-    assert config.application.window_geometry.width == 1280
+    assert config.application.window_geometry.geometry_b64 is None
+    assert config.application.window_geometry.maximized is False
     assert config.workspace.show_layer_panel is True
 
 
@@ -127,9 +128,9 @@ def test_config_serialization_with_bytes():
     workspace = WorkspaceSettings(dock_layout=b"test_dock_layout")
     config = OpenPCBConfig(workspace=workspace)
 
-    # Dump to dict (should base64 encode bytes)
+    # Dump to dict (should hex encode bytes)
     data = config.model_dump_json_safe()
-    assert isinstance(data["workspace"]["dock_layout"], str)  # Base64 string
+    assert isinstance(data["workspace"]["dock_layout"], str)  # Hex string
 
     # Load from dict
     loaded = OpenPCBConfig.model_validate_json_safe(data)
@@ -148,22 +149,18 @@ def test_config_manager_singleton():
 def test_config_manager_persistence():
     """Test config manager save/load."""
     with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create manager with temp directory
-        manager = ConfigManager()
-        manager._config_dir = Path(tmp_dir)
-        manager._config_file = Path(tmp_dir) / "settings.json"
+        # Create isolated manager rooted at the temp directory
+        manager = ConfigManager._new_for_path(Path(tmp_dir))
 
-        # Update and save
+        # Update, then flush the queued background write
         manager.update_display(grid_visible=False, grid_size_mm=2.5)
+        manager.flush()
 
         # Verify file exists
         assert manager._config_file.exists()
 
-        # Create new manager (should load from disk)
-        manager2 = ConfigManager()
-        manager2._config_dir = Path(tmp_dir)
-        manager2._config_file = Path(tmp_dir) / "settings.json"
-        manager2._config = None  # Force reload
+        # Create new manager on the same path (should load from disk)
+        manager2 = ConfigManager._new_for_path(Path(tmp_dir))
 
         loaded_config = manager2.load()
         assert loaded_config.display.grid_visible is False
@@ -173,9 +170,7 @@ def test_config_manager_persistence():
 def test_config_manager_update_methods():
     """Test config manager update methods."""
     with tempfile.TemporaryDirectory() as tmp_dir:
-        manager = ConfigManager()
-        manager._config_dir = Path(tmp_dir)
-        manager._config_file = Path(tmp_dir) / "settings.json"
+        manager = ConfigManager._new_for_path(Path(tmp_dir))
 
         # Test update_display
         manager.update_display(units=Units.INCHES, decimal_places=4)
@@ -194,13 +189,14 @@ def test_config_manager_update_methods():
         manager.update_application(autosave_enabled=False)
         assert manager.config.application.autosave_enabled is False
 
+        # Write out pending changes before the temp directory disappears
+        manager.flush()
+
 
 def test_config_manager_reset():
     """Test config manager reset to defaults."""
     with tempfile.TemporaryDirectory() as tmp_dir:
-        manager = ConfigManager()
-        manager._config_dir = Path(tmp_dir)
-        manager._config_file = Path(tmp_dir) / "settings.json"
+        manager = ConfigManager._new_for_path(Path(tmp_dir))
 
         # Make changes
         manager.update_display(grid_visible=False)
@@ -214,9 +210,7 @@ def test_config_manager_reset():
 def test_config_thread_safety():
     """Test thread-safe access to config."""
     with tempfile.TemporaryDirectory() as tmp_dir:
-        manager = ConfigManager()
-        manager._config_dir = Path(tmp_dir)
-        manager._config_file = Path(tmp_dir) / "settings.json"
+        manager = ConfigManager._new_for_path(Path(tmp_dir))
 
         errors = []
 
@@ -242,6 +236,9 @@ def test_config_thread_safety():
         # Config should be valid
         assert manager.config.display.grid_size_mm > 0
 
+        # Write out pending changes before the temp directory disappears
+        manager.flush()
+
 
 def test_presets():
     """Test configuration presets."""
@@ -276,16 +273,15 @@ def test_presets():
 def test_atomic_writes():
     """Test that config saves are atomic (via temp file)."""
     with tempfile.TemporaryDirectory() as tmp_dir:
-        manager = ConfigManager()
-        manager._config_dir = Path(tmp_dir)
-        manager._config_file = Path(tmp_dir) / "settings.json"
+        manager = ConfigManager._new_for_path(Path(tmp_dir))
 
         # Save config
         manager.update_display(grid_visible=False)
+        manager.flush()
 
         # Verify temp file was used (check that only final file exists)
         assert manager._config_file.exists()
-        assert not (Path(tmp_dir) / "settings.tmp").exists()
+        assert list(Path(tmp_dir).glob("*.tmp")) == []
 
 
 if __name__ == "__main__":